@@ -1,9 +1,22 @@
 """GuideRails: Tutorials-as-Code framework for executable Markdown tutorials."""
 
-from importlib.metadata import PackageNotFoundError, version
+import functools
 
-try:
-    __version__ = version("guiderails")
-except PackageNotFoundError:
-    # Package not installed, likely in development
-    __version__ = "0.0.0"
+
+@functools.cache
+def _get_version() -> str:
+    """Read the installed package version from its metadata."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("guiderails")
+    except PackageNotFoundError:
+        # Package not installed, likely in development
+        return "0.0.0"
+
+
+def __getattr__(name: str):
+    # Resolve __version__ on first access so importing the package stays cheap
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,137 @@
 """Command-line interface for GuideRails."""
 
+import contextlib
+import functools
+import json
 import os
+import signal
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm
-from rich.syntax import Syntax
 
-from . import __version__
 from .config import OutputConfig, VerbosityLevel
 from .executor import Executor, VariableStore
 from .parser import CodeBlock, FileBlock, MarkdownParser, Step, Tutorial
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.text import Text
 
+# Separator printed above the execution summary
+_SUMMARY_SEP = "=" * 60
+
+
+class _BoxChrome(NamedTuple):
+    """Width-dependent border strings of the Execution Results box."""
+
+    top: str
+    bottom: str
+    blank: str
+    separator: str
+
+
+@functools.lru_cache(maxsize=8)
+def _box_chrome(width: int) -> _BoxChrome:
+    """Build the Execution Results box borders for a terminal width."""
+    title = "Execution Results"
+    return _BoxChrome(
+        # "╭─ " + title + " " + dashes + "╮" spans the full width
+        top=f"╭─ [bold green]{title}[/bold green] " + "─" * (width - len(title) - 5) + "╮",
+        bottom="╰" + "─" * (width - 2) + "╯",
+        blank="│" + " " * (width - 2) + "│",
+        separator="─" * (width - 5),
+    )
+
+
+@functools.cache
+def _get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use.
+
+    Rich is imported lazily so that commands which never render output
+    (``--help``, ``--version``) don't pay for it at startup.
+    """
+    from rich.console import Console
+
+    # All styling comes from explicit markup, so skip Rich's auto-highlighter
+    # and :emoji: replacement on every printed string
+    return Console(highlight=False, emoji=False)
+
+
+def __getattr__(name: str):
+    # Keep ``guiderails.cli.console`` available without creating it at import time
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _parallel_group(parts: list, start: int, parallel_all: bool = False) -> list[int]:
+    """Find the run of code blocks beginning at parts[start] that may execute together.
+
+    Blocks marked data-parallel qualify, or every code block if parallel_all is set.
+    Text between blocks doesn't end the run; a file block, a block that doesn't
+    qualify, or one that uses a ${VAR} captured earlier in the run does.
+
+    Returns:
+        Indices into parts of the blocks in the run
+    """
+    group = []
+    captured: set[str] = set()
+    for idx in range(start, len(parts)):
+        part = parts[idx]
+        if isinstance(part, FileBlock):
+            break
+        if not isinstance(part, CodeBlock):
+            continue
+        if not (part.parallel or parallel_all):
+            break
+        if captured & VariableStore.referenced(part.code):
+            break
+        group.append(idx)
+        captured.update(name for name in (part.out_var, part.code_var) if name)
+    return group
+
+
+def _execute_part(
+    executor: Executor,
+    parts: list,
+    idx: int,
+    prefetched: dict[int, tuple],
+    parallel_all: bool = False,
+    on_output: Optional[Callable[[str, bool], None]] = None,
+) -> tuple:
+    """Execute and validate the code block at parts[idx], running its parallel group if any.
+
+    The group starting at idx is run as a whole when its first block is reached,
+    and the results of the remaining blocks are kept in prefetched for later calls.
+    on_output receives a prefetched block's lines once it is reached rather than
+    live, since concurrent output would interleave.
+
+    Returns:
+        Tuple of (result, validation_passed, validation_message)
+    """
+    part = parts[idx]
+    if (part.parallel or parallel_all) and idx not in prefetched:
+        group = _parallel_group(parts, idx, parallel_all)
+        if len(group) > 1:
+            prefetched.update(zip(group, executor.execute_blocks([parts[i] for i in group])))
+
+    if idx not in prefetched:
+        return executor.execute_and_validate(part, on_output)
+
+    outcome = prefetched.pop(idx)
+    if on_output is not None:
+        result = outcome[0]
+        for line in result.stdout.splitlines():
+            on_output(line, False)
+        for line in result.stderr.splitlines():
+            on_output(line, True)
+    return outcome
 
-class GuideRunner:
-    """Runs tutorials in guided or CI mode."""
+
+class _BaseRunner:
+    """State shared by the tutorial runners."""
 
     def __init__(
         self,
@@ -28,24 +139,58 @@ class GuideRunner:
         working_dir: Optional[str] = None,
         guided: bool = True,
         variables: Optional[VariableStore] = None,
-        output_config: Optional[OutputConfig] = None,
+        parallel_blocks: bool = False,
     ):
         """Initialize the runner.
 
         Args:
             tutorial: The tutorial to run
             working_dir: Base working directory for execution
-            guided: Whether to run in guided (interactive) mode
+            guided: Whether to run in guided mode, which keeps going after a failed step
             variables: Variable store for substitution
-            output_config: Output configuration for verbosity and toggles
+            parallel_blocks: Whether to run adjacent independent code blocks concurrently,
+                as if they were all marked data-parallel
         """
         self.tutorial = tutorial
         self.working_dir = working_dir or os.getcwd()
         self.guided = guided
+        self.parallel_blocks = parallel_blocks
         self.variables = variables or VariableStore()
         self.executor = Executor(base_working_dir=self.working_dir, variable_store=self.variables)
         self.failed_steps = []
+
+
+class GuideRunner(_BaseRunner):
+    """Runs tutorials in guided or CI mode."""
+
+    def __init__(
+        self,
+        tutorial: Tutorial,
+        working_dir: Optional[str] = None,
+        guided: bool = True,
+        variables: Optional[VariableStore] = None,
+        output_config: Optional[OutputConfig] = None,
+        parallel_blocks: bool = False,
+    ):
+        """Initialize the runner.
+
+        Args:
+            tutorial: The tutorial to run
+            working_dir: Base working directory for execution
+            guided: Whether to run in guided (interactive) mode
+            variables: Variable store for substitution
+            output_config: Output configuration for verbosity and toggles
+            parallel_blocks: Whether to run adjacent independent code blocks concurrently,
+                as if they were all marked data-parallel
+        """
+        super().__init__(tutorial, working_dir, guided, variables, parallel_blocks)
         self.output_config = output_config or OutputConfig()
+        self.console = _get_console()
+        self._step_count = len(tutorial.steps)
+        # Terminal width, read once and refreshed on resize (see _tracking_resize)
+        self._width = self.console.width
+        # Renderables queued by _out() while a _batched_output() block is active
+        self._pending: Optional[list] = None
 
     def run(self) -> bool:
         """Run the tutorial.
@@ -53,41 +198,44 @@ class GuideRunner:
         Returns:
             True if all steps passed, False otherwise
         """
-        # Display tutorial header (skip in quiet mode)
-        if self.output_config.show_step_banners:
-            console.print()
-            console.print(
-                Panel.fit(
-                    f"[bold cyan]{self.tutorial.title}[/bold cyan]\n"
-                    f"[dim]Source: {self.tutorial.source}[/dim]\n"
-                    f"[dim]Steps: {len(self.tutorial.steps)}[/dim]",
-                    title="GuideRails Tutorial",
-                    border_style="cyan",
-                )
-            )
-            console.print()
+        from rich.panel import Panel
 
-        if not self.tutorial.steps:
-            console.print("[yellow]Warning: No steps found in tutorial[/yellow]")
-            return True
+        with self._tracking_resize():
+            # Display tutorial header (skip in quiet mode)
+            if self.output_config.show_step_banners:
+                with self._batched_output():
+                    self._out()
+                    self._out(
+                        Panel.fit(
+                            f"[bold cyan]{self.tutorial.title}[/bold cyan]\n"
+                            f"[dim]Source: {self.tutorial.source}[/dim]\n"
+                            f"[dim]Steps: {self._step_count}[/dim]",
+                            title="GuideRails Tutorial",
+                            border_style="cyan",
+                        )
+                    )
+                    self._out()
 
-        all_passed = True
+            if not self.tutorial.steps:
+                self.console.print("[yellow]Warning: No steps found in tutorial[/yellow]")
+                return True
 
-        for idx, step in enumerate(self.tutorial.steps, start=1):
-            step_passed = self._run_step(idx, step)
-            if not step_passed:
-                all_passed = False
-                self.failed_steps.append((idx, step))
+            all_passed = True
+
+            for idx, step in enumerate(self.tutorial.steps, start=1):
+                step_passed = self._run_step(idx, step)
+                if not step_passed:
+                    all_passed = False
+                    self.failed_steps.append((idx, step))
 
-                if not step.code_blocks or not any(cb.continue_on_error for cb in step.code_blocks):
-                    if not self.guided:
+                    if not step.any_continue_on_error and not self.guided:
                         # In CI mode, stop on first failure
                         break
 
-        # Display summary
-        self._display_summary(all_passed)
+            # Display summary
+            self._display_summary(all_passed)
 
-        return all_passed
+            return all_passed
 
     def _run_step(self, step_num: int, step: Step) -> bool:
         """Run a single step.
@@ -99,74 +247,159 @@ class GuideRunner:
         Returns:
             True if step passed, False otherwise
         """
-        # Get terminal width for full-width boxes
-        width = console.width
-
-        # Display step header with clear separation (always show, even in quiet)
-        if self.output_config.show_step_banners:
-            console.print()
-            console.print("─" * width)
-            console.print()
-            step_header = f"Step {step_num}/{len(self.tutorial.steps)}: {step.title}"
-            console.print(Panel.fit(f"[bold blue]{step_header}[/bold blue]", border_style="blue"))
-
-            if step.step_id:
-                console.print(f"[dim]ID: {step.step_id}[/dim]")
-        else:
-            # In quiet mode, just show step title
-            console.print()
-            step_header = f"Step {step_num}/{len(self.tutorial.steps)}: {step.title}"
-            console.print(f"[bold blue]{step_header}[/bold blue]")
-
-        # Check if step has executable blocks (code or file)
-        has_blocks = len(step.code_blocks) > 0 or len(step.file_blocks) > 0
-        if not has_blocks:
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.prompt import Confirm
+        from rich.rule import Rule
+
+        # Everything up to the prompt (or the first block) is written in one print
+        with self._batched_output():
+            # Display step header with clear separation (always show, even in quiet)
+            step_header = f"[bold blue]Step {step_num}/{self._step_count}: {step.title}[/bold blue]"
             if self.output_config.show_step_banners:
-                console.print()
-                console.print("[dim]No executable code blocks in this step[/dim]")
-            return True
+                self._out()
+                # Full-width rule, sized by Rich at render time
+                self._out(Rule(style="none"))
+                self._out()
+                self._out(Panel.fit(step_header, border_style="blue"))
+
+                if step.step_id:
+                    self._out(f"[dim]ID: {step.step_id}[/dim]")
+            else:
+                # In quiet mode, just show step title
+                self._out()
+                self._out(step_header)
 
-        # Display step content with inline code blocks in a box (skip in quiet mode)
-        if self.output_config.show_step_banners:
-            console.print()
-            title = "[bold green]Step Content[/bold green]"
-            # Account for "╭─ " prefix and " ╮" suffix when calculating dash count
-            title_len = len("Step Content") + 3  # " " on each side + "─"
-            console.print("╭─ " + title + " " + "─" * (width - title_len - 3) + "╮")
-            self._display_step_content_with_blocks(step)
-            console.print("╰" + "─" * (width - 2) + "╯")
-
-        # In guided mode, ask for confirmation
-        if self.guided:
-            console.print()
-            if self.output_config.show_step_banners:
-                title = "[bold cyan]Confirmation[/bold cyan]"
-                title_len = len("Confirmation") + 3
-                console.print("╭─ " + title + " " + "─" * (width - title_len - 3) + "╮")
-                total_blocks = len(step.code_blocks) + len(step.file_blocks)
-                prompt_text = f"[cyan]▶ Execute the above {total_blocks} block(s)?[/cyan]"
-                self._print_box_line(prompt_text, width)
-                console.print("╰" + "─" * (width - 2) + "╯")
-                console.print()
-
-            if not Confirm.ask("Execute?", default=True):
-                console.print()
+            # Check if step has executable blocks (code or file)
+            has_blocks = len(step.code_blocks) > 0 or len(step.file_blocks) > 0
+            if not has_blocks:
                 if self.output_config.show_step_banners:
-                    title = "[bold yellow]Status[/bold yellow]"
-                    title_len = len("Status") + 3
-                    console.print("╭─ " + title + " " + "─" * (width - title_len - 3) + "╮")
-                    self._print_box_line("[yellow]⊗ Skipped by user[/yellow]", width)
-                    console.print("╰" + "─" * (width - 2) + "╯")
-                else:
-                    console.print("[yellow]⊗ Skipped by user[/yellow]")
-                console.print()
+                    self._out()
+                    self._out("[dim]No executable code blocks in this step[/dim]")
                 return True
 
-        # Execute code blocks and display results
-        console.print()
-        step_passed = self._execute_and_display_results(step)
+            # Display step content with inline code blocks in a box (skip in quiet mode)
+            if self.output_config.show_step_banners:
+                self._out()
+                with self._collected_output() as content:
+                    self._display_step_content_with_blocks(step)
+                self._out(self._box(Group(*content), "[bold green]Step Content[/bold green]"))
 
-        return step_passed
+            # In guided mode, ask for confirmation
+            if self.guided:
+                self._out()
+                if self.output_config.show_step_banners:
+                    total_blocks = len(step.code_blocks) + len(step.file_blocks)
+                    prompt_text = f"[cyan]▶ Execute the above {total_blocks} block(s)?[/cyan]"
+                    self._out(self._box(prompt_text, "[bold cyan]Confirmation[/bold cyan]"))
+                    self._out()
+
+                self._flush_output()
+                if not Confirm.ask("Execute?", default=True):
+                    self._out()
+                    if self.output_config.show_step_banners:
+                        self._out(
+                            self._box(
+                                "[yellow]⊗ Skipped by user[/yellow]",
+                                "[bold yellow]Status[/bold yellow]",
+                            )
+                        )
+                    else:
+                        self._out("[yellow]⊗ Skipped by user[/yellow]")
+                    self._out()
+                    return True
+
+            # Execute code blocks and display results
+            self._out()
+            return self._execute_and_display_results(step)
+
+    @contextlib.contextmanager
+    def _tracking_resize(self):
+        """Keep self._width current by re-reading it on SIGWINCH, where available."""
+        try:
+            previous = signal.signal(signal.SIGWINCH, self._refresh_width)
+        except (AttributeError, ValueError):
+            # No SIGWINCH (Windows), or not running in the main thread
+            yield
+            return
+        try:
+            yield
+        finally:
+            signal.signal(signal.SIGWINCH, previous if previous is not None else signal.SIG_DFL)
+
+    def _refresh_width(self, signum: int, frame: Any) -> None:
+        """Signal handler: re-read the terminal width after a resize."""
+        self._width = self.console.width
+
+    @contextlib.contextmanager
+    def _batched_output(self):
+        """Queue output from _out() and write it with a single console.print on exit.
+
+        Nested uses join the outermost batch.
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            self._flush_output()
+            self._pending = None
+
+    def _out(self, renderable: Any = "") -> None:
+        """Print a renderable, or queue it if output is being batched."""
+        if self._pending is None:
+            self.console.print(renderable)
+        else:
+            self._pending.append(renderable)
+
+    def _flush_output(self) -> None:
+        """Write any queued renderables in one console.print call."""
+        if self._pending:
+            from rich.console import Group
+
+            self.console.print(Group(*self._pending))
+            self._pending.clear()
+
+    @contextlib.contextmanager
+    def _collected_output(self):
+        """Collect output from _out() into a list instead of printing it."""
+        previous, self._pending = self._pending, []
+        try:
+            yield self._pending
+        finally:
+            self._pending = previous
+
+    @staticmethod
+    def _box(renderable: Any, title: str) -> "Panel":
+        """Wrap a renderable in a full-width box with a left-aligned title."""
+        from rich.panel import Panel
+
+        return Panel(renderable, title=title, title_align="left", padding=(0, 1, 0, 2))
+
+    @staticmethod
+    def _code_box(code: str, style: str) -> "Panel":
+        """Wrap code in a square-cornered inner box, shown verbatim (no markup)."""
+        from rich import box
+        from rich.panel import Panel
+        from rich.text import Text
+
+        return Panel(Text(code, style=style), box=box.SQUARE, padding=(0, 1))
+
+    @staticmethod
+    def _params_line(params: list) -> "Text":
+        """Render block parameters as a dim, bracketed line, shown verbatim (no markup)."""
+        from rich.text import Text
+
+        return Text(f"[{', '.join(params)}]", style="dim")
+
+    def _print_output_line(self, line: str, is_stderr: bool) -> None:
+        """Print one line of command output as it is produced (quiet mode).
+
+        Output is printed verbatim: brackets in it are not treated as markup.
+        """
+        self.console.print(line, style="yellow" if is_stderr else None, markup=False)
 
     def _print_box_line(self, text: str, width: int):
         """Print a line inside a box with proper padding to reach the right border.
@@ -175,14 +408,37 @@ class GuideRunner:
             text: The text to print (may contain Rich markup)
             width: Terminal width
         """
-        # Strip Rich markup to calculate actual text length
-        import re
+        from rich.text import Text
 
-        plain_text = re.sub(r"\[/?[^\]]+\]", "", text)
-        text_len = len(plain_text)
+        # Parse the markup once; the Text measures its own width in terminal cells
+        content = Text.from_markup(text, emoji=False)
         # Account for "│  " prefix (3 chars) and " │" suffix (2 chars)
-        padding = width - text_len - 5
-        console.print(f"│  {text}{' ' * max(0, padding)} │")
+        padding = width - content.cell_len - 5
+        line = Text("│  ")
+        line.append_text(content)
+        line.append(f"{' ' * max(0, padding)} │")
+        self._out(line)
+
+    def _print_box_output(self, output: str, width: int):
+        """Print command output inside a box, indented, one bordered line per output line.
+
+        The lines are joined into a single verbatim Text rather than queued one by one.
+
+        Args:
+            output: Raw command output (printed verbatim, never as markup)
+            width: Terminal width
+        """
+        from rich.cells import cell_len
+        from rich.text import Text
+
+        lines = []
+        for line in output.splitlines():
+            if line:
+                # Account for "│    " prefix (5 chars) and " │" suffix (2 chars)
+                padding = width - cell_len(line) - 7
+                lines.append(f"│    {line}{' ' * max(0, padding)} │")
+        if lines:
+            self._out(Text("\n".join(lines)))
 
     def _display_step_content_with_blocks(self, step: Step):
         """Display step content with code blocks shown inline.
@@ -193,8 +449,6 @@ class GuideRunner:
         Args:
             step: The step to display
         """
-        width = console.width
-
         # Use content_parts if available for proper interleaving
         if step.content_parts:
             code_block_idx = 0
@@ -211,18 +465,13 @@ class GuideRunner:
                         file_block_idx += 1
                         self._display_file_block_inline(file_block_idx, part)
                 elif isinstance(part, str) and part.strip():
-                    # This is content text - display with proper padding
-                    lines = part.strip().split("\n")
-                    for line in lines:
-                        self._print_box_line(line, width)
-                    # Add spacing after content block
-                    self._print_box_line("", width)
+                    # This is content text, followed by a spacer line
+                    self._out(part.strip())
+                    self._out()
         elif step.content.strip():
             # Fallback to old behavior if content_parts not available
-            lines = step.content.strip().split("\n")
-            for line in lines:
-                self._print_box_line(line, width)
-            self._print_box_line("", width)
+            self._out(step.content.strip())
+            self._out()
 
             if self.guided:
                 # Display file blocks first
@@ -243,54 +492,35 @@ class GuideRunner:
             code_block: The code block to display
             label: Label for the block type (e.g., "Code", "File")
         """
-        width = console.width
-
-        # Check if substitution will occur at runtime
-        substituted_code = self.variables.substitute(code_block.code)
-        has_substitution = substituted_code != code_block.code
-
-        self._print_box_line(f"[dim]→ {label} Block {block_num} (will execute):[/dim]", width)
-        self._print_box_line("", width)
-
-        # Display code with simple border - adjust inner width to terminal
-        if self.output_config.show_commands:
-            inner_width = width - 8  # Account for "│  ┌" prefix and "┐ │" suffix
-            self._print_box_line("┌" + "─" * inner_width + "┐", width)
-
-            # Always display original code to match tutorial text
-            for line in code_block.code.split("\n"):
-                # Pad code line to inner width
-                plain_line = line
-                line_padding = inner_width - len(plain_line) - 2  # -2 for "│ "
-                padded_code = f"│ [cyan]{line}[/cyan]{' ' * max(0, line_padding)} │"
-                self._print_box_line(padded_code, width)
-            self._print_box_line("└" + "─" * inner_width + "┘", width)
-
-        if has_substitution and self.output_config.show_substituted:
-            self._print_box_line(
-                "[dim](variable substitution will be applied at runtime)[/dim]", width
-            )
-            # In verbose mode, show the substituted command
-            if self.output_config.show_previews:
-                self._print_box_line("[dim]After substitution:[/dim]", width)
-                inner_width = width - 8
-                self._print_box_line("┌" + "─" * inner_width + "┐", width)
-                for line in substituted_code.split("\n"):
-                    plain_line = line
-                    line_padding = inner_width - len(plain_line) - 2
-                    padded_code = f"│ [yellow]{line}[/yellow]{' ' * max(0, line_padding)} │"
-                    self._print_box_line(padded_code, width)
-                self._print_box_line("└" + "─" * inner_width + "┘", width)
+        config = self.output_config
+        show_previews = config.show_previews
+
+        self._out(f"[dim]→ {label} Block {block_num} (will execute):[/dim]")
+        self._out()
+
+        # Always display original code to match tutorial text
+        if config.show_commands:
+            self._out(self._code_box(code_block.code, "cyan"))
+
+        # Only work out the substitution if it is going to be mentioned
+        if config.show_substituted:
+            substituted_code = self.variables.substitute(code_block.code)
+            if substituted_code != code_block.code:
+                self._out("[dim](variable substitution will be applied at runtime)[/dim]")
+                # In verbose mode, show the substituted command
+                if show_previews:
+                    self._out("[dim]After substitution:[/dim]")
+                    self._out(self._code_box(substituted_code, "yellow"))
 
         # Display execution parameters compactly (in verbose+ mode or if show_expected is on)
-        if self.output_config.show_expected or self.output_config.show_previews:
+        if config.show_expected or show_previews:
             params = []
-            if self.output_config.show_expected:
+            if config.show_expected:
                 params.append(f"mode={code_block.mode}")
                 params.append(f"expect={code_block.expected}")
             if code_block.timeout != 30:
                 params.append(f"timeout={code_block.timeout}s")
-            if code_block.working_dir and self.output_config.show_previews:
+            if code_block.working_dir and show_previews:
                 params.append(f"workdir={code_block.working_dir}")
             if code_block.out_var:
                 params.append(f"out-var={code_block.out_var}")
@@ -298,9 +528,13 @@ class GuideRunner:
                 params.append(f"out-file={code_block.out_file}")
             if code_block.code_var:
                 params.append(f"code-var={code_block.code_var}")
+            if code_block.parallel:
+                params.append("parallel=true")
+            if code_block.idempotent:
+                params.append("idempotent=true")
             if params:
-                self._print_box_line(f"[dim][{', '.join(params)}][/dim]", width)
-        self._print_box_line("", width)
+                self._out(self._params_line(params))
+        self._out()
 
     def _display_file_block_inline(self, block_num: int, file_block: FileBlock):
         """Display a file block inline with clear formatting for guided mode.
@@ -309,33 +543,20 @@ class GuideRunner:
             block_num: File block number within step (1-indexed)
             file_block: The file block to display
         """
-        width = console.width
-
         # Check if substitution will occur when file is written
         has_substitution = False
         if file_block.template == "shell":
             substituted = self.variables.substitute(file_block.code)
             has_substitution = substituted != file_block.code
 
-        self._print_box_line(f"[dim]→ File Block {block_num} (will write to file):[/dim]", width)
-        self._print_box_line("", width)
+        self._out(f"[dim]→ File Block {block_num} (will write to file):[/dim]")
+        self._out()
 
-        # Display code with simple border - adjust inner width to terminal
-        inner_width = width - 8  # Account for "│  ┌" prefix and "┐ │" suffix
-        self._print_box_line("┌" + "─" * inner_width + "┐", width)
         # Always display original content to match tutorial text
-        for line in file_block.code.split("\n"):
-            # Pad code line to inner width
-            plain_line = line
-            line_padding = inner_width - len(plain_line) - 2  # -2 for "│ "
-            padded_code = f"│ [green]{line}[/green]{' ' * max(0, line_padding)} │"
-            self._print_box_line(padded_code, width)
-        self._print_box_line("└" + "─" * inner_width + "┘", width)
+        self._out(self._code_box(file_block.code, "green"))
 
         if has_substitution:
-            self._print_box_line(
-                "[dim](variable substitution will be applied when writing)[/dim]", width
-            )
+            self._out("[dim](variable substitution will be applied when writing)[/dim]")
 
         # Display file parameters
         params = [f"path={file_block.path}", f"mode={file_block.mode}"]
@@ -345,8 +566,8 @@ class GuideRunner:
             params.append(f"template={file_block.template}")
         if file_block.once:
             params.append("once=true")
-        self._print_box_line(f"[dim][{', '.join(params)}][/dim]", width)
-        self._print_box_line("", width)
+        self._out(self._params_line(params))
+        self._out()
 
     def _execute_and_display_results(self, step: Step) -> bool:
         """Execute file blocks and code blocks in order, then display results in a box.
@@ -357,24 +578,27 @@ class GuideRunner:
         Returns:
             True if all blocks passed, False otherwise
         """
-        width = console.width
+        from rich.markup import escape
+
+        width = self._width
+        chrome = _box_chrome(width)
         step_passed = True
 
         # In quiet mode, simpler output
         if not self.output_config.show_step_banners:
-            console.print()
+            self._out()
         else:
-            title = "[bold green]Execution Results[/bold green]"
-            title_len = len("Execution Results") + 3
-            console.print("╭─ " + title + " " + "─" * (width - title_len - 3) + "╮")
+            self._out(chrome.top)
 
         # Execute blocks in the order they appear in content_parts
         file_block_num = 0
         code_block_num = 0
         total_blocks = len(step.file_blocks) + len(step.code_blocks)
         current_block = 0
+        # Results of parallel groups, keyed by index in content_parts
+        prefetched: dict[int, tuple] = {}
 
-        for part in step.content_parts:
+        for part_idx, part in enumerate(step.content_parts):
             if isinstance(part, FileBlock):
                 file_block_num += 1
                 current_block += 1
@@ -383,14 +607,15 @@ class GuideRunner:
                     self._print_box_line(
                         f"[bold magenta]File Block {file_block_num}:[/bold magenta]", width
                     )
-                    self._print_box_line("", width)
+                    self._out(chrome.blank)
 
                 # Write file
+                self._flush_output()
                 success, message = self.executor.write_file(part)
 
                 # Display result
                 if self.output_config.show_step_banners:
-                    self._print_box_line("", width)
+                    self._out(chrome.blank)
                     if success:
                         msg = f"[bold green]✓ SUCCESS[/bold green]: {message}"
                         self._print_box_line(msg, width)
@@ -401,15 +626,15 @@ class GuideRunner:
                 else:
                     # Quiet mode
                     if success:
-                        console.print(f"[bold green]✓[/bold green] File: {part.path}")
+                        self._out(f"[bold green]✓[/bold green] File: {part.path}")
                     else:
-                        console.print(f"[bold red]✗ FAILED[/bold red]: {message}")
+                        self._out(f"[bold red]✗ FAILED[/bold red]: {message}")
                         step_passed = False
 
                 if self.output_config.show_step_banners and current_block < total_blocks:
-                    self._print_box_line("", width)
-                    self._print_box_line("─" * (width - 5), width)
-                    self._print_box_line("", width)
+                    self._out(chrome.blank)
+                    self._print_box_line(chrome.separator, width)
+                    self._out(chrome.blank)
 
             elif isinstance(part, CodeBlock):
                 code_block_num += 1
@@ -418,51 +643,48 @@ class GuideRunner:
                 if self.output_config.show_step_banners:
                     msg = f"[bold cyan]Code Block {code_block_num}:[/bold cyan]"
                     self._print_box_line(msg, width)
-                    self._print_box_line("", width)
+                    self._out(chrome.blank)
                 elif self.output_config.show_commands:
                     # In quiet mode with show_commands, show the command
-                    console.print(f"[cyan]$[/cyan] {part.code}")
+                    self._out(f"[cyan]$[/cyan] {escape(part.code)}")
 
-                # Execute
-                result, validation_passed, validation_message = self.executor.execute_and_validate(
-                    part
+                self._flush_output()
+                # Without banners the output isn't boxed, so stream it live
+                on_output = (
+                    None if self.output_config.show_step_banners else self._print_output_line
+                )
+                result, validation_passed, validation_message = _execute_part(
+                    self.executor,
+                    step.content_parts,
+                    part_idx,
+                    prefetched,
+                    self.parallel_blocks,
+                    on_output,
                 )
 
-                # Display output
-                if result.stdout:
-                    if self.output_config.show_step_banners:
+                # Display output (already streamed when banners are off)
+                if self.output_config.show_step_banners:
+                    if result.stdout:
                         self._print_box_line("[bold]Output:[/bold]", width)
-                        for line in result.stdout.split("\n"):
-                            if line:
-                                # Add extra indent for output
-                                self._print_box_line(f"  {line}", width)
-                    else:
-                        # Quiet mode - just show output directly
-                        console.print(result.stdout.rstrip())
+                        self._print_box_output(result.stdout, width)
 
-                if result.stderr:
-                    if self.output_config.show_step_banners:
-                        self._print_box_line("", width)
+                    if result.stderr:
+                        self._out(chrome.blank)
                         self._print_box_line("[bold yellow]Error Output:[/bold yellow]", width)
-                        for line in result.stderr.split("\n"):
-                            if line:
-                                self._print_box_line(f"  {line}", width)
-                    else:
-                        # Quiet mode - show stderr
-                        console.print(f"[yellow]{result.stderr.rstrip()}[/yellow]")
+                        self._print_box_output(result.stderr, width)
 
                 # Display capture info if variables were set
                 if part.out_var and self.output_config.show_captured:
                     captured = self.variables.get(part.out_var)
                     if self.output_config.show_step_banners:
-                        self._print_box_line("", width)
+                        self._out(chrome.blank)
                         msg = (
                             f"[dim]Captured to variable {part.out_var}: "
                             f"{len(captured)} chars[/dim]"
                         )
                         self._print_box_line(msg, width)
                     else:
-                        console.print(f"[dim]→ {part.out_var}[/dim]")
+                        self._out(f"[dim]→ {part.out_var}[/dim]")
 
                 if part.code_var and self.output_config.show_captured:
                     exit_code = self.variables.get(part.code_var)
@@ -471,11 +693,11 @@ class GuideRunner:
                             f"[dim]Captured exit code to {part.code_var}: {exit_code}[/dim]", width
                         )
                     else:
-                        console.print(f"[dim]→ {part.code_var}={exit_code}[/dim]")
+                        self._out(f"[dim]→ {part.code_var}={exit_code}[/dim]")
 
                 # Display validation result (always show failures)
                 if self.output_config.show_step_banners:
-                    self._print_box_line("", width)
+                    self._out(chrome.blank)
                     if validation_passed:
                         self._print_box_line(
                             f"[bold green]✓ PASSED[/bold green]: {validation_message}", width
@@ -495,11 +717,11 @@ class GuideRunner:
                 else:
                     # Quiet mode - show pass/fail
                     if validation_passed:
-                        console.print("[bold green]✓ PASSED[/bold green]")
+                        self._out("[bold green]✓ PASSED[/bold green]")
                     else:
-                        console.print(f"[bold red]✗ FAILED[/bold red]: {validation_message}")
+                        self._out(f"[bold red]✗ FAILED[/bold red]: {validation_message}")
                         if part.continue_on_error:
-                            console.print("[yellow]Continuing despite failure[/yellow]")
+                            self._out("[yellow]Continuing despite failure[/yellow]")
                         else:
                             step_passed = False
 
@@ -507,148 +729,182 @@ class GuideRunner:
                     break
 
                 if self.output_config.show_step_banners and current_block < total_blocks:
-                    self._print_box_line("", width)
-                    self._print_box_line("─" * (width - 5), width)
-                    self._print_box_line("", width)
+                    self._out(chrome.blank)
+                    self._print_box_line(chrome.separator, width)
+                    self._out(chrome.blank)
 
         if self.output_config.show_step_banners:
-            self._print_box_line("", width)
+            self._out(chrome.blank)
             # Update border color based on results
             if not step_passed:
-                console.print("╰" + "─" * (width - 2) + "╯ [red]✗ Failed[/red]")
+                self._out(chrome.bottom + " [red]✗ Failed[/red]")
             else:
-                console.print("╰" + "─" * (width - 2) + "╯ [green]✓ Passed[/green]")
+                self._out(chrome.bottom + " [green]✓ Passed[/green]")
         else:
-            console.print()
+            self._out()
 
         return step_passed
 
-    def _display_code_block(self, block_num: int, code_block: CodeBlock):
-        """Display a code block without executing it.
+    def _display_summary(self, all_passed: bool):
+        """Display execution summary."""
+        from rich.panel import Panel
 
-        Args:
-            block_num: Code block number within step (1-indexed)
-            code_block: The code block to display
+        with self._batched_output():
+            self._out()
+            self._out(_SUMMARY_SEP)
+            self._out()
+
+            if all_passed:
+                self._out(
+                    Panel.fit("[bold green]✓ All steps passed![/bold green]", border_style="green")
+                )
+            else:
+                failed_count = len(self.failed_steps)
+                self._out(
+                    Panel.fit(
+                        f"[bold red]✗ {failed_count} step(s) failed[/bold red]", border_style="red"
+                    )
+                )
+
+                if self.failed_steps:
+                    self._out()
+                    self._out("[bold]Failed steps:[/bold]")
+                    for step_num, step in self.failed_steps:
+                        self._out(f"  - Step {step_num}: {step.title}")
+
+
+class JsonlRunner(_BaseRunner):
+    """Runs tutorials non-interactively, reporting progress as JSON Lines on stdout.
+
+    Each line is one event object with an "event" key: tutorial_start, step_start,
+    block_result, step_end and summary. Rich is never used. In guided mode it keeps
+    going after a failed step, but never prompts.
+    """
+
+    @staticmethod
+    def emit(event: dict[str, Any], flush: bool = False) -> None:
+        """Write one event as a JSON line."""
+        sys.stdout.write(json.dumps(event, ensure_ascii=False) + "\n")
+        if flush:
+            sys.stdout.flush()
+
+    def run(self) -> bool:
+        """Run the tutorial.
+
+        Returns:
+            True if all steps passed, False otherwise
         """
-        console.print(f"[bold]Block {block_num}:[/bold]")
+        self.emit(
+            {
+                "event": "tutorial_start",
+                "title": self.tutorial.title,
+                "source": self.tutorial.source,
+                "steps": len(self.tutorial.steps),
+            }
+        )
 
-        # Display code with syntax highlighting
-        syntax = Syntax(code_block.code, code_block.language, theme="monokai", line_numbers=False)
-        console.print(Panel(syntax, border_style="cyan"))
+        all_passed = True
+        for idx, step in enumerate(self.tutorial.steps, start=1):
+            self.emit({"event": "step_start", "step": idx, "title": step.title, "id": step.step_id})
+            step_passed = self._run_step(idx, step)
+            # One flush per step, so consumers see progress without a write per event
+            self.emit({"event": "step_end", "step": idx, "passed": step_passed}, flush=True)
+
+            if not step_passed:
+                all_passed = False
+                self.failed_steps.append((idx, step))
 
-        # Display execution parameters
-        params = []
-        params.append(f"Validation: {code_block.mode} = {code_block.expected}")
-        if code_block.timeout != 30:
-            params.append(f"Timeout: {code_block.timeout}s")
-        if code_block.working_dir:
-            params.append(f"Working dir: {code_block.working_dir}")
-        console.print(f"[dim]{' | '.join(params)}[/dim]")
-        console.print()
+                if not step.any_continue_on_error and not self.guided:
+                    break
 
-    def _run_code_block(self, step_num: int, block_num: int, code_block: CodeBlock) -> bool:
-        """Run a single code block.
+        self.emit(
+            {
+                "event": "summary",
+                "passed": all_passed,
+                "failed_steps": [step_num for step_num, _ in self.failed_steps],
+            },
+            flush=True,
+        )
+        return all_passed
 
-        Args:
-            step_num: Step number (1-indexed)
-            block_num: Code block number within step (1-indexed)
-            code_block: The code block to run
+    def _run_step(self, step_num: int, step: Step) -> bool:
+        """Execute a step's blocks in order, emitting a block_result for each.
 
         Returns:
-            True if validation passed, False otherwise
+            True if step passed, False otherwise
         """
-        # In CI mode, display the code block first
-        if not self.guided:
-            console.print()
-            console.print(f"[bold]Code Block {block_num}:[/bold]")
-
-            # Display code
-            syntax = Syntax(
-                code_block.code, code_block.language, theme="monokai", line_numbers=False
-            )
-            console.print(Panel(syntax, border_style="green"))
-
-            # Display execution parameters
-            console.print(f"[dim]Validation: {code_block.mode} = {code_block.expected}[/dim]")
-            if code_block.timeout != 30:
-                console.print(f"[dim]Timeout: {code_block.timeout}s[/dim]")
-            if code_block.working_dir:
-                console.print(f"[dim]Working dir: {code_block.working_dir}[/dim]")
-            console.print()
-
-        # In guided mode, just show we're executing this specific block
-        if self.guided:
-            console.print(f"[cyan]▶ Executing Block {block_num}...[/cyan]")
-
-        # Execute
-        if self.guided:
-            result, validation_passed, validation_message = self.executor.execute_and_validate(
-                code_block
-            )
-        else:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True,
-            ) as progress:
-                progress.add_task(description="Executing...", total=None)
-                result, validation_passed, validation_message = self.executor.execute_and_validate(
-                    code_block
+        step_passed = True
+        file_block_num = 0
+        code_block_num = 0
+        # Results of parallel groups, keyed by index in content_parts
+        prefetched: dict[int, tuple] = {}
+
+        for part_idx, part in enumerate(step.content_parts):
+            if isinstance(part, FileBlock):
+                file_block_num += 1
+                success, message = self.executor.write_file(part)
+                self.emit(
+                    {
+                        "event": "block_result",
+                        "step": step_num,
+                        "type": "file",
+                        "block": file_block_num,
+                        "line": part.line_number,
+                        "path": part.path,
+                        "passed": success,
+                        "message": message,
+                    }
                 )
+                if not success:
+                    step_passed = False
 
-        # Display output
-        if result.stdout:
-            console.print()
-            console.print("[bold]Output:[/bold]")
-            console.print(result.stdout)
-
-        if result.stderr:
-            console.print()
-            console.print("[bold yellow]Error Output:[/bold yellow]")
-            console.print(result.stderr)
-
-        # Display validation result
-        console.print()
-        if validation_passed:
-            console.print(f"[bold green]✓ PASSED[/bold green]: {validation_message}")
-            console.print()
-            return True
-        else:
-            console.print(f"[bold red]✗ FAILED[/bold red]: {validation_message}")
-            if code_block.continue_on_error:
-                msg = "[yellow]Continuing despite failure (continue-on-error=true)[/yellow]"
-                console.print(msg)
-            console.print()
-            return False
+            elif isinstance(part, CodeBlock):
+                code_block_num += 1
+                result, validation_passed, validation_message = _execute_part(
+                    self.executor, step.content_parts, part_idx, prefetched, self.parallel_blocks
+                )
 
-    def _display_summary(self, all_passed: bool):
-        """Display execution summary."""
-        console.print()
-        console.print("=" * 60)
-        console.print()
-
-        if all_passed:
-            console.print(
-                Panel.fit("[bold green]✓ All steps passed![/bold green]", border_style="green")
-            )
-        else:
-            failed_count = len(self.failed_steps)
-            console.print(
-                Panel.fit(
-                    f"[bold red]✗ {failed_count} step(s) failed[/bold red]", border_style="red"
+                self.emit(
+                    {
+                        "event": "block_result",
+                        "step": step_num,
+                        "type": "code",
+                        "block": code_block_num,
+                        "line": part.line_number,
+                        "passed": validation_passed,
+                        "message": validation_message,
+                        "exit_code": result.exit_code,
+                        "stdout": result.stdout,
+                        "stderr": result.stderr,
+                    }
                 )
-            )
 
-            if self.failed_steps:
-                console.print()
-                console.print("[bold]Failed steps:[/bold]")
-                for step_num, step in self.failed_steps:
-                    console.print(f"  - Step {step_num}: {step.title}")
+                if not validation_passed and not part.continue_on_error:
+                    step_passed = False
+                    break
+
+        return step_passed
+
+
+def _show_version(ctx: click.Context, param: click.Parameter, value: bool):
+    """Print the version and exit; package metadata is only read when asked for."""
+    if not value or ctx.resilient_parsing:
+        return
+    from . import __version__
+
+    click.echo(f"{ctx.find_root().info_name}, version {__version__}")
+    ctx.exit()
 
 
 @click.group()
-@click.version_option(version=__version__)
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_show_version,
+    help="Show the version and exit.",
+)
 def cli():
     """GuideRails: Tutorials-as-Code framework."""
     pass
@@ -659,6 +915,11 @@ def cli():
 @click.option("--guided", is_flag=True, help="Run in interactive/guided mode")
 @click.option("--ci", is_flag=True, help="Run in CI mode (non-interactive)")
 @click.option("--working-dir", "-w", type=click.Path(), help="Base working directory for execution")
+@click.option(
+    "--parallel-blocks",
+    is_flag=True,
+    help="Run a step's independent adjacent code blocks concurrently",
+)
 # Verbosity options
 @click.option(
     "--verbosity",
@@ -692,6 +953,7 @@ def exec(
     guided: bool,
     ci: bool,
     working_dir: Optional[str],
+    parallel_blocks: bool,
     # Verbosity options
     verbosity: Optional[str],
     quiet: bool,
@@ -715,10 +977,20 @@ def exec(
     - A URL to a Markdown file
     - A URL to an HTML page with <meta name="guiderails:source"> tag
     """
+    # JSON Lines output is for machines: no Rich console, errors are events too
+    jsonl = output == "jsonl"
+    console = None if jsonl else _get_console()
+
+    def fail(message: str):
+        if jsonl:
+            JsonlRunner.emit({"event": "error", "message": message}, flush=True)
+        else:
+            console.print(f"[red]{message}[/red]")
+        sys.exit(1)
+
     # Determine mode
     if guided and ci:
-        console.print("[red]Error: Cannot specify both --guided and --ci[/red]")
-        sys.exit(1)
+        fail("Error: Cannot specify both --guided and --ci")
 
     # Default to guided if neither specified
     is_guided = guided or not ci
@@ -745,33 +1017,41 @@ def exec(
 
     try:
         # Show loading message only in normal+ verbosity
-        if output_config.should_show_at_level(VerbosityLevel.NORMAL):
+        show_loading = not jsonl and output_config.should_show_at_level(VerbosityLevel.NORMAL)
+        if show_loading:
             console.print(f"[cyan]Loading tutorial from: {tutorial}[/cyan]")
 
-        if tutorial.startswith("http://") or tutorial.startswith("https://"):
+        if tutorial.startswith(("http://", "https://")):
             # URL
             parsed_tutorial = parser.parse_url(tutorial)
         else:
             # Local file
             parsed_tutorial = parser.parse_file(tutorial)
 
-        if output_config.should_show_at_level(VerbosityLevel.NORMAL):
+        if show_loading:
             console.print(f"[green]✓ Loaded: {parsed_tutorial.title}[/green]")
 
     except FileNotFoundError as e:
-        console.print(f"[red]Error: {e}[/red]")
-        sys.exit(1)
+        fail(f"Error: {e}")
     except Exception as e:
-        console.print(f"[red]Error loading tutorial: {e}[/red]")
-        sys.exit(1)
+        fail(f"Error loading tutorial: {e}")
 
     # Run tutorial
-    runner = GuideRunner(
-        parsed_tutorial,
-        working_dir=working_dir,
-        guided=is_guided,
-        output_config=output_config,
-    )
+    if jsonl:
+        runner = JsonlRunner(
+            parsed_tutorial,
+            working_dir=working_dir,
+            guided=is_guided,
+            parallel_blocks=parallel_blocks,
+        )
+    else:
+        runner = GuideRunner(
+            parsed_tutorial,
+            working_dir=working_dir,
+            guided=is_guided,
+            output_config=output_config,
+            parallel_blocks=parallel_blocks,
+        )
 
     success = runner.run()
 
@@ -1,36 +1,85 @@
 """Configuration management for GuideRails verbosity and output controls."""
 
+import copy
+import importlib.util
 import os
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
 from typing import Optional
 
-try:
-    import yaml
+# Only check that PyYAML is installed; it is imported once a guiderails.yml is found
+HAS_YAML = importlib.util.find_spec("yaml") is not None
 
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+# guiderails.yml files parsed so far, keyed by (path, mtime_ns); an edited file re-parses
+_parsed_config_files: dict[tuple[Path, int], Optional["OutputConfig"]] = {}
 
 
-class VerbosityLevel(Enum):
-    """Verbosity levels for output control."""
+class VerbosityLevel(IntEnum):
+    """Verbosity levels for output control, ordered from least to most output."""
 
-    QUIET = "quiet"
-    NORMAL = "normal"
-    VERBOSE = "verbose"
-    DEBUG = "debug"
+    QUIET = 0
+    NORMAL = 1
+    VERBOSE = 2
+    DEBUG = 3
 
     @classmethod
     def from_string(cls, value: str) -> "VerbosityLevel":
         """Convert string to VerbosityLevel."""
         try:
-            return cls(value.lower())
-        except ValueError:
+            return cls[value.upper()]
+        except KeyError:
             return cls.NORMAL
 
 
+# Output toggles implied by each verbosity level
+_VERBOSITY_PRESETS: dict[VerbosityLevel, dict[str, bool]] = {
+    # Minimal output
+    VerbosityLevel.QUIET: {
+        "show_step_banners": False,
+        "show_previews": False,
+        "show_timestamps": False,
+        "show_substituted": False,
+    },
+    # Default behavior
+    VerbosityLevel.NORMAL: {
+        "show_step_banners": True,
+        "show_previews": False,
+        "show_timestamps": False,
+        "show_substituted": False,
+    },
+    # Show more details
+    VerbosityLevel.VERBOSE: {
+        "show_step_banners": True,
+        "show_previews": True,
+        "show_timestamps": True,
+        "show_substituted": True,
+    },
+    # Show everything
+    VerbosityLevel.DEBUG: {
+        "show_step_banners": True,
+        "show_previews": True,
+        "show_timestamps": True,
+        "show_substituted": True,
+    },
+}
+
+
+# Environment variables that override individual output toggles
+_ENV_OVERRIDES: tuple[tuple[str, str], ...] = (
+    ("GUIDERAILS_SHOW_COMMANDS", "show_commands"),
+    ("GUIDERAILS_SHOW_SUBSTITUTED", "show_substituted"),
+    ("GUIDERAILS_SHOW_EXPECTED", "show_expected"),
+    ("GUIDERAILS_SHOW_CAPTURED", "show_captured"),
+    ("GUIDERAILS_TIMESTAMPS", "show_timestamps"),
+    ("GUIDERAILS_STEP_BANNERS", "show_step_banners"),
+    ("GUIDERAILS_PREVIEWS", "show_previews"),
+)
+
+# Environment variable values that count as true
+_TRUTHY_VALUES = frozenset(("true", "1", "yes", "on"))
+
+
 @dataclass
 class OutputConfig:
     """Configuration for output behavior and verbosity."""
@@ -59,30 +108,8 @@ class OutputConfig:
 
     def _apply_verbosity_presets(self):
         """Apply default settings based on verbosity level."""
-        if self.verbosity == VerbosityLevel.QUIET:
-            # Minimal output
-            self.show_step_banners = False
-            self.show_previews = False
-            self.show_timestamps = False
-            self.show_substituted = False
-        elif self.verbosity == VerbosityLevel.NORMAL:
-            # Default behavior (current)
-            self.show_step_banners = True
-            self.show_previews = False
-            self.show_timestamps = False
-            self.show_substituted = False
-        elif self.verbosity == VerbosityLevel.VERBOSE:
-            # Show more details
-            self.show_step_banners = True
-            self.show_previews = True
-            self.show_timestamps = True
-            self.show_substituted = True
-        elif self.verbosity == VerbosityLevel.DEBUG:
-            # Show everything
-            self.show_step_banners = True
-            self.show_previews = True
-            self.show_timestamps = True
-            self.show_substituted = True
+        for name, value in _VERBOSITY_PRESETS[self.verbosity].items():
+            setattr(self, name, value)
 
     @classmethod
     def from_cli_and_env(
@@ -213,7 +240,7 @@ class OutputConfig:
             return VerbosityLevel.from_string(env_verbosity)
 
         # 4. Config file
-        if config_level:
+        if config_level is not None:
             return config_level
 
         # 5. Default
@@ -221,22 +248,11 @@ class OutputConfig:
 
     def _apply_env_overrides(self):
         """Apply environment variable overrides for toggle flags."""
-        env_vars = {
-            "GUIDERAILS_SHOW_COMMANDS": "show_commands",
-            "GUIDERAILS_SHOW_SUBSTITUTED": "show_substituted",
-            "GUIDERAILS_SHOW_EXPECTED": "show_expected",
-            "GUIDERAILS_SHOW_CAPTURED": "show_captured",
-            "GUIDERAILS_TIMESTAMPS": "show_timestamps",
-            "GUIDERAILS_STEP_BANNERS": "show_step_banners",
-            "GUIDERAILS_PREVIEWS": "show_previews",
-        }
-
-        for env_var, attr_name in env_vars.items():
+        for env_var, attr_name in _ENV_OVERRIDES:
             value = os.environ.get(env_var)
             if value is not None:
                 # Parse boolean value
-                bool_value = value.lower() in ("true", "1", "yes", "on")
-                setattr(self, attr_name, bool_value)
+                setattr(self, attr_name, value.lower() in _TRUTHY_VALUES)
 
     @classmethod
     def _load_config_file(cls) -> Optional["OutputConfig"]:
@@ -254,8 +270,19 @@ class OutputConfig:
         current_dir = Path.cwd()
         for parent in [current_dir] + list(current_dir.parents):
             config_file = parent / "guiderails.yml"
-            if config_file.exists():
-                return cls._parse_config_file(config_file)
+            try:
+                # One stat both finds the file and dates it
+                mtime = config_file.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            key = (config_file, mtime)
+            if key not in _parsed_config_files:
+                _parsed_config_files[key] = cls._parse_config_file(config_file)
+            parsed = _parsed_config_files[key]
+            # Callers modify the result, so hand out a copy; copy.copy skips
+            # __post_init__, which would reset the file's toggles to presets
+            return copy.copy(parsed) if parsed else None
 
         return None
 
@@ -269,9 +296,17 @@ class OutputConfig:
         Returns:
             OutputConfig instance or None if parsing fails
         """
+        import yaml
+
+        try:
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
+
         try:
-            with open(config_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # libyaml takes the raw bytes, so skip the text-mode file wrapper
+            data = yaml.load(config_file.read_bytes(), Loader=YamlLoader)
 
             if not isinstance(data, dict):
                 return None
@@ -313,12 +348,4 @@ class OutputConfig:
         Returns:
             True if current level >= min_level
         """
-        levels = [
-            VerbosityLevel.QUIET,
-            VerbosityLevel.NORMAL,
-            VerbosityLevel.VERBOSE,
-            VerbosityLevel.DEBUG,
-        ]
-        current_idx = levels.index(self.verbosity)
-        min_idx = levels.index(min_level)
-        return current_idx >= min_idx
+        return self.verbosity >= min_level
@@ -1,11 +1,15 @@
 """Command executor and output validator for GuideRails."""
 
+import functools
 import os
 import re
 import stat
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 from .parser import CodeBlock, FileBlock
 
@@ -13,6 +17,9 @@ from .parser import CodeBlock, FileBlock
 class VariableStore:
     """Stores and manages variables for substitution."""
 
+    # Pattern to match ${VAR_NAME}
+    VAR_PATTERN = re.compile(r"\$\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
+
     def __init__(self, initial_vars: Optional[dict[str, str]] = None):
         """Initialize variable store.
 
@@ -20,10 +27,16 @@ class VariableStore:
             initial_vars: Optional initial variables (e.g., from CLI --var)
         """
         self.variables: dict[str, str] = initial_vars or {}
+        # substitute() results for the current variable values; cleared by set()
+        self._substituted: dict[str, str] = {}
+        # Blocks running concurrently may capture variables while others substitute
+        self._lock = threading.Lock()
 
     def set(self, name: str, value: str):
         """Set a variable value."""
-        self.variables[name] = value
+        with self._lock:
+            self.variables[name] = value
+            self._substituted.clear()
 
     def get(self, name: str, default: str = "") -> str:
         """Get a variable value."""
@@ -38,14 +51,28 @@ class VariableStore:
         Returns:
             Text with substitutions applied
         """
-        # Pattern to match ${VAR_NAME}
-        pattern = re.compile(r"\$\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
+        # Most blocks reference no variables at all
+        if "$" not in text:
+            return text
+
+        # The same block text is substituted for its preview and again to run it
+        cached = self._substituted.get(text)
+        if cached is not None:
+            return cached
 
         def replace_var(match):
             var_name = match.group(1)
             return self.variables.get(var_name, match.group(0))  # Return original if not found
 
-        return pattern.sub(replace_var, text)
+        # Hold the lock so a concurrent set() can't leave a stale result memoized
+        with self._lock:
+            result = self._substituted[text] = self.VAR_PATTERN.sub(replace_var, text)
+        return result
+
+    @classmethod
+    def referenced(cls, text: str) -> frozenset[str]:
+        """Return the names of the ${VAR} references in text."""
+        return frozenset(cls.VAR_PATTERN.findall(text))
 
 
 class PathSandbox:
@@ -81,8 +108,7 @@ class PathSandbox:
             base_abs = os.path.abspath(base_dir)
             try:
                 # Check if resolved path is under base_dir
-                os.path.relpath(resolved, base_abs)
-                if not resolved.startswith(base_abs + os.sep) and resolved != base_abs:
+                if os.path.commonpath((resolved, base_abs)) != base_abs:
                     return (
                         False,
                         "",
@@ -95,6 +121,12 @@ class PathSandbox:
         return True, resolved, ""
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_expected(pattern: str) -> "re.Pattern[str]":
+    """Compile a data-exp regex once, however many blocks or runs reuse it."""
+    return re.compile(pattern, re.MULTILINE)
+
+
 @dataclass
 class ExecutionResult:
     """Result of executing a code block."""
@@ -139,7 +171,7 @@ class Validator:
             # Match output against regex pattern
             output = result.stdout + result.stderr
             try:
-                if re.search(expected, output, re.MULTILINE):
+                if _compile_expected(expected).search(output):
                     return True, f"Output matches regex: {expected}"
                 else:
                     return False, f"Output does not match regex: {expected}"
@@ -167,6 +199,9 @@ class Validator:
 class Executor:
     """Executes code blocks and validates output."""
 
+    # Number of idempotent block outcomes kept for reuse
+    IDEMPOTENT_CACHE_SIZE = 64
+
     def __init__(
         self,
         base_working_dir: Optional[str] = None,
@@ -184,6 +219,14 @@ class Executor:
         self.validator = Validator()
         self.variables = variable_store or VariableStore()
         self.allow_outside = allow_outside
+        # Resolved once so each sandbox check skips the cwd lookup
+        self._base_abs = os.path.abspath(self.base_working_dir)
+        # Outcomes of idempotent blocks, keyed by (command, working_dir), oldest first
+        self._idempotent_runs: OrderedDict[tuple[str, str], subprocess.CompletedProcess] = (
+            OrderedDict()
+        )
+        # Parallel blocks may read and update the cache from several threads
+        self._idempotent_lock = threading.Lock()
 
     def write_file(self, file_block: FileBlock) -> tuple[bool, str]:
         """Write a file from a FileBlock.
@@ -196,7 +239,7 @@ class Executor:
         """
         # Validate path
         is_valid, resolved_path, error = PathSandbox.validate_path(
-            file_block.path, self.base_working_dir, self.allow_outside
+            file_block.path, self._base_abs, self.allow_outside
         )
         if not is_valid:
             return False, error
@@ -236,11 +279,17 @@ class Executor:
         except Exception as e:
             return False, f"Failed to write file: {str(e)}"
 
-    def execute_code_block(self, code_block: CodeBlock) -> ExecutionResult:
+    def execute_code_block(
+        self,
+        code_block: CodeBlock,
+        on_output: Optional[Callable[[str, bool], None]] = None,
+    ) -> ExecutionResult:
         """Execute a code block and return the result.
 
         Args:
             code_block: The code block to execute
+            on_output: Optional callback invoked with (line, is_stderr) for each
+                line of output as it is produced. Output is still captured in full.
 
         Returns:
             ExecutionResult with execution details
@@ -269,15 +318,28 @@ class Executor:
             )
 
         try:
-            # Execute command
-            process = subprocess.run(
-                command,
-                shell=True,
-                cwd=working_dir,
-                capture_output=True,
-                timeout=code_block.timeout,
-                text=True,
-            )
+            # Execute command, unless an idempotent block already ran it here
+            run_key = (command, working_dir)
+            process = self._cached_run(run_key) if code_block.idempotent else None
+            if process is not None:
+                if on_output is not None:
+                    for is_stderr, output in ((False, process.stdout), (True, process.stderr)):
+                        for line in output.splitlines():
+                            on_output(line, is_stderr)
+            elif on_output is None:
+                process = subprocess.run(
+                    command,
+                    shell=True,
+                    cwd=working_dir,
+                    capture_output=True,
+                    timeout=code_block.timeout,
+                    text=True,
+                )
+            else:
+                process = self._run_streaming(command, working_dir, code_block.timeout, on_output)
+
+            if code_block.idempotent:
+                self._cache_run(run_key, process)
 
             result = ExecutionResult(
                 success=process.returncode == 0,
@@ -294,7 +356,7 @@ class Executor:
             # Capture output to file if requested
             if code_block.out_file:
                 is_valid, resolved_path, error = PathSandbox.validate_path(
-                    code_block.out_file, self.base_working_dir, self.allow_outside
+                    code_block.out_file, self._base_abs, self.allow_outside
                 )
                 if is_valid:
                     try:
@@ -330,16 +392,104 @@ class Executor:
                 error_message=f"Execution error: {str(e)}",
             )
 
-    def execute_and_validate(self, code_block: CodeBlock) -> tuple[ExecutionResult, bool, str]:
+    def _cached_run(self, run_key: tuple[str, str]) -> Optional[subprocess.CompletedProcess]:
+        """Return the recorded outcome of an idempotent command, if any."""
+        with self._idempotent_lock:
+            process = self._idempotent_runs.get(run_key)
+            if process is not None:
+                self._idempotent_runs.move_to_end(run_key)
+            return process
+
+    def _cache_run(self, run_key: tuple[str, str], process: subprocess.CompletedProcess):
+        """Record an idempotent command's outcome, evicting the least recently used."""
+        with self._idempotent_lock:
+            self._idempotent_runs[run_key] = process
+            if len(self._idempotent_runs) > self.IDEMPOTENT_CACHE_SIZE:
+                self._idempotent_runs.popitem(last=False)
+
+    @staticmethod
+    def _run_streaming(
+        command: str,
+        working_dir: str,
+        timeout: int,
+        on_output: Callable[[str, bool], None],
+    ) -> subprocess.CompletedProcess:
+        """Run a shell command, passing each output line to on_output as it arrives.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command runs longer than timeout
+            Exception: The first error raised while reading output or by on_output
+        """
+        process = subprocess.Popen(
+            command,
+            shell=True,
+            cwd=working_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        captured: dict[bool, list[str]] = {False: [], True: []}
+        # Reader failures, re-raised once both pipes are drained
+        errors: list[Exception] = []
+        # Set on timeout so output from orphaned children no longer reaches on_output
+        stopped = threading.Event()
+
+        def pump(pipe, is_stderr: bool):
+            # One reader per pipe so neither can fill up and block the child
+            try:
+                for line in pipe:
+                    captured[is_stderr].append(line)
+                    if not stopped.is_set():
+                        on_output(line.rstrip("\n"), is_stderr)
+            except Exception as e:
+                errors.append(e)
+                # Keep draining, or a chatty child blocks on the full pipe
+                while pipe.buffer.read(65536):
+                    pass
+            finally:
+                pipe.close()
+
+        readers = [
+            threading.Thread(target=pump, args=(process.stdout, False), daemon=True),
+            threading.Thread(target=pump, args=(process.stderr, True), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Like subprocess.run, don't wait on pipes that orphaned children may hold
+            stopped.set()
+            process.kill()
+            process.wait()
+            raise
+
+        for reader in readers:
+            reader.join()
+        if errors:
+            raise errors[0]
+
+        return subprocess.CompletedProcess(
+            command, process.returncode, "".join(captured[False]), "".join(captured[True])
+        )
+
+    def execute_and_validate(
+        self,
+        code_block: CodeBlock,
+        on_output: Optional[Callable[[str, bool], None]] = None,
+    ) -> tuple[ExecutionResult, bool, str]:
         """Execute a code block and validate its output.
 
         Args:
             code_block: The code block to execute
+            on_output: Optional per-line output callback (see execute_code_block)
 
         Returns:
             Tuple of (ExecutionResult, validation_success, validation_message)
         """
-        result = self.execute_code_block(code_block)
+        result = self.execute_code_block(code_block, on_output)
 
         # If execution failed with error, validation fails
         if result.error_message:
@@ -349,3 +499,62 @@ class Executor:
         validation_success, validation_message = self.validator.validate(result, code_block)
 
         return result, validation_success, validation_message
+
+    def execute_blocks(
+        self, code_blocks: list[CodeBlock]
+    ) -> list[tuple[ExecutionResult, bool, str]]:
+        """Execute code blocks concurrently and validate each.
+
+        A block waits for the earlier blocks it shares a ${VAR} with: one that
+        captures a variable it uses, uses a variable it captures, or captures
+        the same variable. Blocks must not otherwise depend on each other's files.
+
+        Args:
+            code_blocks: The code blocks to execute
+
+        Returns:
+            List of (result, validation_passed, validation_message), in the
+            same order as code_blocks
+        """
+        if len(code_blocks) <= 1:
+            return [self.execute_and_validate(code_block) for code_block in code_blocks]
+
+        # Threads only wait on their subprocesses, so neither the GIL nor the
+        # CPU count bounds the useful number of workers
+        max_workers = min(len(code_blocks), 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Blocks are submitted in order, so a waiting block's prerequisites
+            # have always been picked up by a worker already
+            futures: list[Future] = []
+            for code_block, after in zip(code_blocks, _block_dependencies(code_blocks)):
+                prerequisites = [futures[idx] for idx in after]
+                futures.append(pool.submit(self._execute_after, prerequisites, code_block))
+            return [future.result() for future in futures]
+
+    def _execute_after(
+        self, prerequisites: list[Future], code_block: CodeBlock
+    ) -> tuple[ExecutionResult, bool, str]:
+        """Execute and validate a code block once its prerequisite blocks finish."""
+        wait(prerequisites)
+        return self.execute_and_validate(code_block)
+
+
+def _block_dependencies(code_blocks: list[CodeBlock]) -> list[list[int]]:
+    """Find, for each code block, the earlier blocks it must run after.
+
+    Returns:
+        One list of indices into code_blocks per block
+    """
+    uses = [VariableStore.referenced(code_block.code) for code_block in code_blocks]
+    captures = [
+        frozenset(name for name in (code_block.out_var, code_block.code_var) if name)
+        for code_block in code_blocks
+    ]
+    return [
+        [
+            earlier
+            for earlier in range(idx)
+            if captures[earlier] & (uses[idx] | captures[idx]) or uses[earlier] & captures[idx]
+        ]
+        for idx in range(len(code_blocks))
+    ]
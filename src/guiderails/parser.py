@@ -2,12 +2,8 @@
 
 import re
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any, Optional
 
-import requests
-from bs4 import BeautifulSoup
-
 
 @dataclass
 class CodeBlock:
@@ -20,6 +16,8 @@ class CodeBlock:
     timeout: int = 30
     working_dir: Optional[str] = None
     continue_on_error: bool = False
+    parallel: bool = False  # May run concurrently with adjacent parallel blocks
+    idempotent: bool = False  # Same command and directory always give the same result
     line_number: int = 0
     # Capture attributes
     out_var: Optional[str] = None  # Variable name to store stdout/stderr
@@ -54,6 +52,13 @@ class Step:
     content_parts: list[Any] = field(
         default_factory=list
     )  # Ordered list of strings, CodeBlocks, and FileBlocks
+    # Whether any code block sets continue-on-error (kept up to date by the parser)
+    any_continue_on_error: bool = False
+
+    def __post_init__(self):
+        """Derive cached flags from any code blocks passed at construction."""
+        if not self.any_continue_on_error:
+            self.any_continue_on_error = any(cb.continue_on_error for cb in self.code_blocks)
 
 
 @dataclass
@@ -79,11 +84,13 @@ class MarkdownParser:
 
     def parse_file(self, filepath: str) -> Tutorial:
         """Parse a Markdown file from filesystem."""
-        path = Path(filepath)
-        if not path.exists():
-            raise FileNotFoundError(f"Tutorial file not found: {filepath}")
+        # Open directly rather than stat-ing first; a missing file fails the open
+        try:
+            with open(filepath, encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Tutorial file not found: {filepath}") from None
 
-        content = path.read_text(encoding="utf-8")
         return self.parse_markdown(content, source=filepath)
 
     def parse_url(self, url: str) -> Tutorial:
@@ -92,31 +99,38 @@ class MarkdownParser:
         If the URL is an HTML page, look for <meta name="guiderails:source">
         to find the raw Markdown file URL.
         """
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-
-        content_type = response.headers.get("Content-Type", "")
-
-        # If it's HTML, look for meta tag
-        if "text/html" in content_type:
-            soup = BeautifulSoup(response.text, "html.parser")
-            meta_tag = soup.find("meta", attrs={"name": "guiderails:source"})
-
-            if meta_tag and meta_tag.get("content"):
-                raw_url = meta_tag["content"]
-                # Fetch the actual Markdown file
-                md_response = requests.get(raw_url, timeout=30)
-                md_response.raise_for_status()
-                content = md_response.text
-                return self.parse_markdown(content, source=raw_url)
+        # Imported here so local-file runs don't pay for the HTTP/HTML stack
+        import requests
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        # One session so the follow-up Markdown fetch can reuse the connection
+        with requests.Session() as session:
+            response = session.get(url, timeout=30)
+            response.raise_for_status()
+
+            content_type = response.headers.get("Content-Type", "")
+
+            # If it's HTML, look for meta tag
+            if "text/html" in content_type:
+                # Only <meta> tags matter, so skip building a tree for the rest of the page
+                soup = BeautifulSoup(response.text, "html.parser", parse_only=SoupStrainer("meta"))
+                meta_tag = soup.find("meta", attrs={"name": "guiderails:source"})
+
+                if meta_tag and meta_tag.get("content"):
+                    raw_url = meta_tag["content"]
+                    # Fetch the actual Markdown file
+                    md_response = session.get(raw_url, timeout=30)
+                    md_response.raise_for_status()
+                    content = md_response.text
+                    return self.parse_markdown(content, source=raw_url)
+                else:
+                    raise ValueError(
+                        f"HTML page at {url} does not contain <meta name='guiderails:source'> tag"
+                    )
             else:
-                raise ValueError(
-                    f"HTML page at {url} does not contain <meta name='guiderails:source'> tag"
-                )
-        else:
-            # Assume it's Markdown
-            content = response.text
-            return self.parse_markdown(content, source=url)
+                # Assume it's Markdown
+                content = response.text
+                return self.parse_markdown(content, source=url)
 
     def parse_markdown(self, content: str, source: str = "<string>") -> Tutorial:
         """Parse Markdown content into a Tutorial object."""
@@ -174,6 +188,8 @@ class MarkdownParser:
                         if current_step:
                             current_step.code_blocks.append(code_block)
                             current_step.content_parts.append(code_block)
+                            if code_block.continue_on_error:
+                                current_step.any_continue_on_error = True
 
                     # Process if it has .gr-file class
                     elif "gr-file" in code_block_attrs.get("classes", []):
@@ -288,6 +304,8 @@ class MarkdownParser:
             timeout=int(data.get("timeout", 30)),
             working_dir=data.get("workdir"),
             continue_on_error=data.get("continue-on-error", "").lower() == "true",
+            parallel=data.get("parallel", "").lower() == "true",
+            idempotent=data.get("idempotent", "").lower() == "true",
             line_number=line_number,
             out_var=data.get("out-var"),
             out_file=data.get("out-file"),
@@ -0,0 +1,76 @@
+"""Tests for the command-line interface."""
+
+import json
+
+from click.testing import CliRunner
+
+from guiderails.cli import cli
+
+
+def test_exec_jsonl_output(tmp_path):
+    """Test that --output jsonl emits one JSON event per line."""
+    tutorial = tmp_path / "tutorial.md"
+    tutorial.write_text("""# Tutorial
+
+## Step One {.gr-step}
+
+```bash {.gr-run}
+echo hello
+```
+""")
+
+    result = CliRunner().invoke(cli, ["exec", "--ci", "--output", "jsonl", str(tutorial)])
+
+    assert result.exit_code == 0
+    events = [json.loads(line) for line in result.output.splitlines()]
+    assert [e["event"] for e in events] == [
+        "tutorial_start",
+        "step_start",
+        "block_result",
+        "step_end",
+        "summary",
+    ]
+    assert events[2]["stdout"] == "hello\n"
+    assert events[2]["passed"] is True
+    assert events[-1] == {"event": "summary", "passed": True, "failed_steps": []}
+
+
+def test_exec_jsonl_failure(tmp_path):
+    """Test that a failing block is reported and stops the run in CI mode."""
+    tutorial = tmp_path / "tutorial.md"
+    tutorial.write_text("""# Tutorial
+
+## Step One {.gr-step}
+
+```bash {.gr-run}
+exit 3
+```
+
+## Step Two {.gr-step}
+
+```bash {.gr-run}
+echo never
+```
+""")
+
+    result = CliRunner().invoke(cli, ["exec", "--ci", "--output", "jsonl", str(tutorial)])
+
+    assert result.exit_code == 1
+    events = [json.loads(line) for line in result.output.splitlines()]
+    block = next(e for e in events if e["event"] == "block_result")
+    assert block["exit_code"] == 3
+    assert block["passed"] is False
+    assert events[-1] == {"event": "summary", "passed": False, "failed_steps": [1]}
+    assert not any(e["event"] == "step_start" and e["step"] == 2 for e in events)
+
+
+def test_exec_jsonl_missing_file(tmp_path):
+    """Test that load errors are reported as an error event."""
+    result = CliRunner().invoke(
+        cli, ["exec", "--ci", "--output", "jsonl", str(tmp_path / "missing.md")]
+    )
+
+    assert result.exit_code == 1
+    event = json.loads(result.output)
+    assert event["event"] == "error"
+    assert "not found" in event["message"]
@@ -192,6 +192,47 @@ show_timestamps: true
         os.chdir(original_dir)
 
 
+def test_config_file_quiet_verbosity(tmp_path, monkeypatch):
+    """Test that verbosity: quiet in guiderails.yml is applied rather than treated as unset."""
+    monkeypatch.delenv("GUIDERAILS_VERBOSITY", raising=False)
+    config_file = tmp_path / "guiderails.yml"
+    config_file.write_text("verbosity: quiet\n")
+
+    original_dir = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        config = OutputConfig.from_cli_and_env()
+        assert config.verbosity == VerbosityLevel.QUIET
+        assert config.show_step_banners is False
+
+        config = OutputConfig.from_cli_and_env(is_ci=True)
+        assert config.verbosity == VerbosityLevel.QUIET
+    finally:
+        os.chdir(original_dir)
+
+
+def test_config_file_loading_is_memoized(tmp_path):
+    """Test that a reloaded config file is a fresh copy and edits are picked up."""
+    config_file = tmp_path / "guiderails.yml"
+    config_file.write_text("verbosity: verbose\nshow_commands: false\n")
+
+    original_dir = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        first = OutputConfig._load_config_file()
+        first.show_commands = True
+        second = OutputConfig._load_config_file()
+
+        assert second is not first
+        assert second.show_commands is False
+
+        config_file.write_text("verbosity: debug\n")
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000_000))
+        assert OutputConfig._load_config_file().verbosity == VerbosityLevel.DEBUG
+    finally:
+        os.chdir(original_dir)
+
+
 def test_should_show_at_level():
     """Test should_show_at_level method."""
     quiet_config = OutputConfig(verbosity=VerbosityLevel.QUIET)
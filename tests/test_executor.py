@@ -231,6 +231,27 @@ def test_variable_substitution_no_match():
     assert result == "Hello Test, value is ${MISSING}"
 
 
+def test_variable_substitution_after_set():
+    """Test that a repeated substitution picks up variables set in between."""
+    from guiderails.executor import VariableStore
+
+    store = VariableStore({"NAME": "Alice"})
+    text = "Hello ${NAME}"
+    assert store.substitute(text) == "Hello Alice"
+    assert store.substitute(text) == "Hello Alice"
+
+    store.set("NAME", "Bob")
+    assert store.substitute(text) == "Hello Bob"
+
+
+def test_variable_store_referenced():
+    """Test listing the ${VAR} names a text refers to."""
+    from guiderails.executor import VariableStore
+
+    assert VariableStore.referenced("echo ${A} ${B} ${A} $C") == {"A", "B"}
+    assert VariableStore.referenced("echo plain") == set()
+
+
 def test_path_sandbox_relative_path():
     """Test path sandbox validates relative paths."""
     import tempfile
@@ -279,6 +300,16 @@ def test_path_sandbox_rejects_traversal():
         assert "traversal" in error.lower()
 
 
+def test_path_sandbox_sibling_prefix(tmp_path):
+    """Test path sandbox rejects a sibling directory sharing the base name as prefix."""
+    from guiderails.executor import PathSandbox
+
+    base = tmp_path / "work"
+    is_valid, resolved, error = PathSandbox.validate_path("../work-other/x.txt", str(base), False)
+    assert is_valid is False
+    assert "traversal" in error.lower()
+
+
 def test_write_file_basic(tmp_path):
     """Test writing a file with FileBlock."""
     from guiderails.parser import FileBlock
@@ -509,3 +540,117 @@ def test_execute_with_all_captures(tmp_path):
     assert store.get("OUT") == "Output"
     assert store.get("CODE") == "5"
     assert (tmp_path / "result.txt").exists()
+
+
+def test_execute_streams_output():
+    """Test that on_output receives each line while output is still captured."""
+    executor = Executor()
+    code_block = CodeBlock(code="echo one; echo two >&2; echo three")
+    lines = []
+
+    result = executor.execute_code_block(
+        code_block, on_output=lambda line, is_stderr: lines.append((line, is_stderr))
+    )
+
+    assert result.success is True
+    assert result.stdout == "one\nthree\n"
+    assert result.stderr == "two\n"
+    assert [line for line, is_stderr in lines if not is_stderr] == ["one", "three"]
+    assert ("two", True) in lines
+
+
+def test_execute_streaming_timeout():
+    """Test that timeout still applies when streaming output."""
+    executor = Executor()
+    code_block = CodeBlock(code="echo start; sleep 10", timeout=1)
+    lines = []
+
+    result = executor.execute_code_block(
+        code_block, on_output=lambda line, is_stderr: lines.append(line)
+    )
+
+    assert result.success is False
+    assert "timed out" in result.error_message.lower()
+    assert lines == ["start"]
+
+
+def test_execute_streaming_undecodable_output():
+    """Test that non-UTF-8 output while streaming is reported as an execution error."""
+    executor = Executor()
+    code_block = CodeBlock(code=r"printf 'ok\n\377\nafter\n'", mode="contains", expected="after")
+    lines = []
+
+    result = executor.execute_code_block(
+        code_block, on_output=lambda line, is_stderr: lines.append(line)
+    )
+
+    assert result.success is False
+    assert "execution error" in result.error_message.lower()
+
+
+def test_execute_streaming_timeout_drops_late_output():
+    """Test that output from an orphaned child after a timeout isn't streamed."""
+    import time
+
+    executor = Executor()
+    code_block = CodeBlock(code="(sleep 1.5; echo late) & sleep 10", timeout=1)
+    lines = []
+
+    result = executor.execute_code_block(
+        code_block, on_output=lambda line, is_stderr: lines.append(line)
+    )
+    time.sleep(1)
+
+    assert "timed out" in result.error_message.lower()
+    assert lines == []
+
+
+def test_execute_blocks():
+    """Test that independent blocks overlap and results keep block order."""
+    import time
+
+    executor = Executor()
+    code_blocks = [
+        CodeBlock(code="sleep 1; echo first"),
+        CodeBlock(code="echo second"),
+        CodeBlock(code="sleep 1; exit 1"),
+    ]
+
+    start = time.monotonic()
+    results = executor.execute_blocks(code_blocks)
+    elapsed = time.monotonic() - start
+
+    assert [r[0].stdout.strip() for r in results] == ["first", "second", ""]
+    assert [r[1] for r in results] == [True, True, False]
+    # Run one after another, the sleeps alone would take 2s
+    assert elapsed < 1.8
+
+
+def test_execute_blocks_waits_for_captured_variable():
+    """Test that a block using a captured variable runs after the block capturing it."""
+    executor = Executor()
+    code_blocks = [
+        CodeBlock(code="sleep 0.3; echo first", out_var="FIRST"),
+        CodeBlock(code="echo got ${FIRST}"),
+        CodeBlock(code="echo other"),
+    ]
+
+    results = executor.execute_blocks(code_blocks)
+
+    assert [r[0].stdout.strip() for r in results] == ["first", "got first", "other"]
+
+
+def test_execute_idempotent_reuses_result(tmp_path):
+    """Test that an idempotent block runs once per command and directory."""
+    executor = Executor(base_working_dir=str(tmp_path))
+    code_block = CodeBlock(code="echo run >> runs.txt; echo hi", idempotent=True)
+
+    first = executor.execute_code_block(code_block)
+    second = executor.execute_code_block(code_block)
+
+    assert first.stdout == second.stdout == "hi\n"
+    assert (tmp_path / "runs.txt").read_text() == "run\n"
+
+    # Blocks without the flag always run
+    executor.execute_code_block(CodeBlock(code=code_block.code))
+    assert (tmp_path / "runs.txt").read_text() == "run\nrun\n"
@@ -1,5 +1,7 @@
 """Tests for the Markdown parser."""
 
+import pytest
+
 from guiderails.parser import MarkdownParser
 
 
@@ -160,6 +162,63 @@ false
     tutorial = parser.parse_markdown(markdown)
 
     assert tutorial.steps[0].code_blocks[0].continue_on_error is True
+    assert tutorial.steps[0].any_continue_on_error is True
+
+
+def test_parse_parallel():
+    """Test parsing parallel flag."""
+    markdown = """# Tutorial
+
+## Step {.gr-step}
+
+```bash {.gr-run data-parallel=true}
+echo a
+```
+
+```bash {.gr-run}
+echo b
+```
+"""
+
+    parser = MarkdownParser()
+    tutorial = parser.parse_markdown(markdown)
+
+    assert tutorial.steps[0].code_blocks[0].parallel is True
+    assert tutorial.steps[0].code_blocks[1].parallel is False
+
+
+def test_parse_idempotent():
+    """Test parsing idempotent flag."""
+    markdown = """# Tutorial
+
+## Step {.gr-step}
+
+```bash {.gr-run data-idempotent=true}
+python --version
+```
+"""
+
+    parser = MarkdownParser()
+    tutorial = parser.parse_markdown(markdown)
+
+    assert tutorial.steps[0].code_blocks[0].idempotent is True
+
+
+def test_step_any_continue_on_error_default():
+    """Test that steps without continue-on-error blocks report False."""
+    markdown = """# Tutorial
+
+## Step {.gr-step}
+
+```bash {.gr-run}
+true
+```
+"""
+
+    parser = MarkdownParser()
+    tutorial = parser.parse_markdown(markdown)
+
+    assert tutorial.steps[0].any_continue_on_error is False
 
 
 def test_parse_working_dir():
@@ -341,3 +400,28 @@ bash script.sh
     assert len(tutorial.steps[0].file_blocks) == 1
     assert len(tutorial.steps[0].code_blocks) == 1
     assert len(tutorial.steps[0].content_parts) == 2
+
+
+def test_parse_file(tmp_path):
+    """Test parsing a tutorial from disk, including CRLF line endings."""
+    tutorial_file = tmp_path / "tutorial.md"
+    tutorial_file.write_bytes(
+        b"# Disk Tutorial\r\n\r\n## Step {.gr-step}\r\n\r\n"
+        b"```bash {.gr-run}\r\necho hi\r\n```\r\n"
+    )
+
+    parser = MarkdownParser()
+    tutorial = parser.parse_file(str(tutorial_file))
+
+    assert tutorial.title == "Disk Tutorial"
+    assert tutorial.source == str(tutorial_file)
+    assert tutorial.steps[0].code_blocks[0].code == "echo hi"
+
+
+def test_parse_file_not_found(tmp_path):
+    """Test that a missing tutorial file raises FileNotFoundError."""
+    parser = MarkdownParser()
+    missing = tmp_path / "missing.md"
+
+    with pytest.raises(FileNotFoundError, match="Tutorial file not found"):
+        parser.parse_file(str(missing))